@@ -180,13 +180,15 @@ class BaseResourceManager(ABC, Generic[T]):
                 result[row[keys[0]]] = row[keys[1]]
         return result
 
-    def _escape_identifier(self, identifier: str) -> str:
+    @staticmethod
+    def _escape_identifier(identifier: str) -> str:
         """Escape SQL identifier (table/column names)."""
         # Escape double quotes by doubling them
         escaped_identifier = identifier.replace('"', '""')
         return f'"{escaped_identifier}"'
 
-    def _escape_string(self, value: str) -> str:
+    @staticmethod
+    def _escape_string(value: str) -> str:
         """Escape SQL string literal."""
         escaped_value = value.replace("'", "''")
         return f"'{escaped_value}'"
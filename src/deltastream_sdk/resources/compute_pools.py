@@ -60,14 +60,20 @@ class ComputePoolManager(BaseResourceManager[ComputePool]):
         escaped_name = self._escape_identifier(name)
         return f"DROP COMPUTE_POOL {escaped_name}"
 
+    def _get_start_sql(self, name: str) -> str:
+        """Generate SQL for starting a compute pool."""
+        escaped_name = self._escape_identifier(name)
+        return f"START COMPUTE_POOL {escaped_name}"
+
+    def _get_stop_sql(self, name: str) -> str:
+        """Generate SQL for stopping a compute pool."""
+        escaped_name = self._escape_identifier(name)
+        return f"STOP COMPUTE_POOL {escaped_name}"
+
     async def start(self, name: str) -> None:
         """Start a compute pool."""
-        escaped_name = self._escape_identifier(name)
-        sql = f"START COMPUTE_POOL {escaped_name}"
-        await self._execute_sql(sql)
+        await self._execute_sql(self._get_start_sql(name))
 
     async def stop(self, name: str) -> None:
         """Stop a compute pool."""
-        escaped_name = self._escape_identifier(name)
-        sql = f"STOP COMPUTE_POOL {escaped_name}"
-        await self._execute_sql(sql)
+        await self._execute_sql(self._get_stop_sql(name))
@@ -96,6 +96,16 @@ class StreamManager(BaseResourceManager[Stream]):
         escaped_name = self._escape_identifier(name)
         return f"DROP STREAM {escaped_name}"
 
+    def _get_start_sql(self, name: str) -> str:
+        """Generate SQL for starting a stream."""
+        escaped_name = self._escape_identifier(name)
+        return f"START STREAM {escaped_name}"
+
+    def _get_stop_sql(self, name: str) -> str:
+        """Generate SQL for stopping a stream."""
+        escaped_name = self._escape_identifier(name)
+        return f"STOP STREAM {escaped_name}"
+
     # Additional stream-specific operations
     async def create_from_select(
         self,
@@ -135,15 +145,11 @@ class StreamManager(BaseResourceManager[Stream]):
 
     async def start(self, name: str) -> None:
         """Start a stream (if supported by DeltaStream)."""
-        escaped_name = self._escape_identifier(name)
-        sql = f"START STREAM {escaped_name}"
-        await self._execute_sql(sql)
+        await self._execute_sql(self._get_start_sql(name))
 
     async def stop(self, name: str) -> None:
         """Stop a stream (if supported by DeltaStream)."""
-        escaped_name = self._escape_identifier(name)
-        sql = f"STOP STREAM {escaped_name}"
-        await self._execute_sql(sql)
+        await self._execute_sql(self._get_stop_sql(name))
 
     async def get_status(self, name: str) -> Dict[str, Any]:
         """Get stream status information."""
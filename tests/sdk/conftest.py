@@ -2,9 +2,15 @@
 Pytest configuration and fixtures for SDK tests.
 """
 
+import asyncio
+import functools
+import inspect
+import re
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch, Mock
-from typing import List, Dict, Any
+from unittest.mock import AsyncMock, MagicMock, patch, Mock, call
+from collections import ChainMap
+from types import MappingProxyType, SimpleNamespace
+from typing import List, Any, Mapping, Tuple
 import sys
 
 
@@ -27,6 +33,171 @@ sys.modules["deltastream.api.conn"] = mock_api.conn
 
 # Import SDK components after mocking
 from deltastream_sdk import DeltaStreamClient  # noqa: E402
+from deltastream_sdk.resources import (  # noqa: E402
+    StreamManager,
+    StoreManager,
+    DatabaseManager,
+    ComputePoolManager,
+    EntityManager,
+)
+
+
+class AsyncStub:
+    """Awaitable call recorder returning a fixed value.
+
+    A cheaper stand-in for ``AsyncMock`` when a test only needs the awaited
+    return value and the recorded calls.
+    """
+
+    def __init__(self, return_value: Any = None):
+        self.return_value = return_value
+        self.call_args_list: List[Any] = []
+
+    async def __call__(self, *args, **kwargs):
+        self.call_args_list.append(call(*args, **kwargs))
+        return self.return_value
+
+    @property
+    def call_args(self):
+        """The most recent call, or ``None`` if never called."""
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    @property
+    def call_count(self) -> int:
+        """Number of times the stub has been awaited."""
+        return len(self.call_args_list)
+
+    def assert_called_once_with(self, *args, **kwargs) -> None:
+        """Assert the stub was called exactly once with the given arguments."""
+        expected = [call(*args, **kwargs)]
+        assert self.call_args_list == expected, self.call_args_list
+
+    def assert_not_called(self) -> None:
+        """Assert the stub was never called."""
+        assert not self.call_args_list, self.call_args_list
+
+
+class StubConnection:
+    """Connection double exposing only the ``exec``/``query`` coroutines.
+
+    Resource managers never touch anything else on the connection, so this
+    avoids building an ``AsyncMock`` tree for every resource test.
+    """
+
+    def __init__(self):
+        self.exec = AsyncStub()
+        self.query = AsyncStub()
+
+
+class StubRows:
+    """Re-iterable stand-in for the rows returned by ``conn.query``.
+
+    Immutable, so a single instance can be shared between tests.
+    """
+
+    def __init__(
+        self, column_names: Tuple[str, ...], rows: Tuple[Tuple[Any, ...], ...]
+    ):
+        self._columns = tuple(SimpleNamespace(name=name) for name in column_names)
+        self._rows = rows
+
+    def columns(self) -> List[Any]:
+        return list(self._columns)
+
+    async def __aiter__(self):
+        for row in self._rows:
+            yield list(row)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_rows(names: Tuple[str, ...]) -> StubRows:
+    """LIST result rows for ``names``, built once per distinct tuple."""
+    return StubRows(("Name",), tuple((name,) for name in names))
+
+
+@functools.lru_cache(maxsize=None)
+def _describe_rows(rows: Tuple[Tuple[str, str], ...]) -> StubRows:
+    """DESCRIBE result rows for ``rows``, built once per distinct tuple."""
+    return StubRows(("property", "value"), rows)
+
+
+def describe_result(data: Mapping[str, Any]) -> StubRows:
+    """DESCRIBE rows for ``data``, shared between calls with equal data."""
+    # Convert data to DESCRIBE format (key-value pairs)
+    return _describe_rows(tuple(sorted((k, str(v)) for k, v in data.items())))
+
+
+def with_name(base: Mapping[str, Any], name: str) -> ChainMap:
+    """View of ``base`` with ``Name`` overridden, without copying.
+
+    Writes to the returned ``ChainMap`` land in its ``Name`` overlay and
+    never reach ``base``.
+    """
+    return ChainMap({"Name": name}, base)
+
+
+def last_exec_sql(conn) -> str:
+    """Return the SQL passed to the most recent ``conn.exec`` call."""
+    return conn.exec.call_args.args[0]
+
+
+def joined_exec_sql(conn) -> str:
+    """Return the SQL of every ``conn.exec`` call, one statement per line."""
+    return "\n".join(c.args[0] for c in conn.exec.call_args_list)
+
+
+def assert_exec_sql(conn, expected_sql: str) -> None:
+    """Assert ``conn.exec`` was called exactly once, with ``expected_sql``."""
+    assert conn.exec.call_count == 1
+    assert conn.exec.call_args.args == (expected_sql,)
+
+
+def assert_contains_all(sql: str, *fragments: str) -> None:
+    """Assert that every expected fragment appears in ``sql``."""
+    missing = [fragment for fragment in fragments if fragment not in sql]
+    assert not missing, f"missing fragments {missing} in: {sql}"
+
+
+def assert_exec_contains(conn, *fragments: str) -> str:
+    """Assert the last ``conn.exec`` SQL contains every fragment; return it."""
+    sql = last_exec_sql(conn)
+    assert_contains_all(sql, *fragments)
+    return sql
+
+
+# A single-quoted SQL literal, allowing doubled quotes inside
+_SQL_LITERAL = r"'(?:''|[^'])*'"
+_WITH_CLAUSE = re.compile(rf"WITH \(((?:{_SQL_LITERAL}|[^')])*)\)")
+_WITH_PARAM = re.compile(rf"{_SQL_LITERAL} = (?:{_SQL_LITERAL}|[^,)\s']+)")
+_WITH_SEPARATOR = ", "
+
+
+def canonicalize_sql(sql: str) -> str:
+    """Sort the ``WITH (...)`` parameters of ``sql`` by key.
+
+    Makes generated SQL comparable against a golden string regardless of
+    the order in which parameters were passed. Fails on anything inside
+    ``WITH (...)`` that is not a ``', '``-separated list of parameters.
+    """
+
+    def _sort_params(match: re.Match) -> str:
+        clause = match.group(1)
+        params = []
+        pos = 0
+        while True:
+            param = _WITH_PARAM.match(clause, pos)
+            assert param, f"malformed WITH parameter at {clause[pos:]!r} in: {sql}"
+            params.append(param.group())
+            pos = param.end()
+            if pos == len(clause):
+                break
+            assert clause.startswith(_WITH_SEPARATOR, pos), (
+                f"malformed WITH separator at {clause[pos:]!r} in: {sql}"
+            )
+            pos += len(_WITH_SEPARATOR)
+        return f"WITH ({_WITH_SEPARATOR.join(sorted(params))})"
+
+    return _WITH_CLAUSE.sub(_sort_params, sql)
 
 
 @pytest.fixture
@@ -48,6 +219,29 @@ def mock_connection():
     return mock_conn
 
 
+@pytest.fixture
+def aio_benchmark(benchmark):
+    """``benchmark`` wrapper that also accepts coroutine functions.
+
+    Coroutines are driven on a private event loop, so tests using this
+    fixture must be plain ``def`` tests.
+    """
+    with asyncio.Runner() as runner:
+
+        def _benchmark(func, *args, **kwargs):
+            if inspect.iscoroutinefunction(func):
+                return benchmark(lambda: runner.run(func(*args, **kwargs)))
+            return benchmark(func, *args, **kwargs)
+
+        yield _benchmark
+
+
+@pytest.fixture
+def stub_connection():
+    """Lightweight connection for tests that only await exec/query."""
+    return StubConnection()
+
+
 @pytest.fixture
 def mock_query_rows():
     """Mock query result rows."""
@@ -69,124 +263,148 @@ def mock_query_rows():
 
 
 @pytest.fixture
-def client_with_mock_connection(mock_connection):
-    """DeltaStreamClient with mocked connection."""
-    return DeltaStreamClient(connection=mock_connection)
+def stream_manager(mock_connection):
+    """StreamManager bound to the mock connection."""
+    return StreamManager(mock_connection)
 
 
 @pytest.fixture
-def sample_stream_data():
-    """Sample stream data for testing."""
-    return {
-        "Name": "test_stream",
-        "Owner": "test_user",
-        "Type": "STREAM",
-        "State": "RUNNING",
-        "Properties": {},
-        "CreatedAt": "2024-01-01 00:00:00.000",
-        "UpdatedAt": "2024-01-01 00:00:00.000",
-        "Path": ["test_stream"],
-    }
+def store_manager(mock_connection):
+    """StoreManager bound to the mock connection."""
+    return StoreManager(mock_connection)
 
 
 @pytest.fixture
-def sample_store_data():
-    """Sample store data for testing."""
-    return {
-        "Name": "test_store",
-        "Type": "KAFKA",
-        "State": "ready",
-        "Message": "",
-        "IsDefault": False,
-        "Owner": "test_user",
-        "CreatedAt": "2024-01-01 00:00:00.000",
-        "UpdatedAt": "2024-01-01 00:00:00.000",
-        "Path": ["test_store"],
-    }
+def database_manager(mock_connection):
+    """DatabaseManager bound to the mock connection."""
+    return DatabaseManager(mock_connection)
 
 
 @pytest.fixture
-def sample_database_data():
-    """Sample database data for testing."""
-    return {
-        "Name": "test_database",
-        "IsDefault": False,
-        "Owner": "test_user",
-        "CreatedAt": "2024-01-01 00:00:00.000",
-        "Path": ["test_database"],
-    }
+def compute_pool_manager(mock_connection):
+    """ComputePoolManager bound to the mock connection."""
+    return ComputePoolManager(mock_connection)
 
 
 @pytest.fixture
-def sample_compute_pool_data():
-    """Sample compute pool data for testing."""
-    return {
-        "Name": "test_pool",
-        "IntendedState": "running",
-        "ActualState": "running",
-        "ErrorMessages": "",
-        "Size": "MEDIUM",
-        "Timeout": 300,
-        "Owner": "test_user",
-        "CreatedAt": "2024-01-01 00:00:00.000",
-        "UpdatedAt": "2024-01-01 00:00:00.000",
-        "Path": ["test_pool"],
-    }
+def entity_manager(mock_connection):
+    """EntityManager bound to the mock connection."""
+    return EntityManager(mock_connection)
 
 
 @pytest.fixture
+def client_with_mock_connection(mock_connection):
+    """DeltaStreamClient with mocked connection."""
+    return DeltaStreamClient(connection=mock_connection)
+
+
+@pytest.fixture(scope="session")
+def sample_stream_data():
+    """Deeply read-only sample stream data shared across the session."""
+    return MappingProxyType(
+        {
+            "Name": "test_stream",
+            "Owner": "test_user",
+            "Type": "STREAM",
+            "State": "RUNNING",
+            "Properties": MappingProxyType({}),
+            "CreatedAt": "2024-01-01 00:00:00.000",
+            "UpdatedAt": "2024-01-01 00:00:00.000",
+            "Path": ("test_stream",),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_store_data():
+    """Deeply read-only sample store data shared across the session."""
+    return MappingProxyType(
+        {
+            "Name": "test_store",
+            "Type": "KAFKA",
+            "State": "ready",
+            "Message": "",
+            "IsDefault": False,
+            "Owner": "test_user",
+            "CreatedAt": "2024-01-01 00:00:00.000",
+            "UpdatedAt": "2024-01-01 00:00:00.000",
+            "Path": ("test_store",),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_database_data():
+    """Deeply read-only sample database data shared across the session."""
+    return MappingProxyType(
+        {
+            "Name": "test_database",
+            "IsDefault": False,
+            "Owner": "test_user",
+            "CreatedAt": "2024-01-01 00:00:00.000",
+            "Path": ("test_database",),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_compute_pool_data():
+    """Deeply read-only sample compute pool data shared across the session."""
+    return MappingProxyType(
+        {
+            "Name": "test_pool",
+            "IntendedState": "running",
+            "ActualState": "running",
+            "ErrorMessages": "",
+            "Size": "MEDIUM",
+            "Timeout": 300,
+            "Owner": "test_user",
+            "CreatedAt": "2024-01-01 00:00:00.000",
+            "UpdatedAt": "2024-01-01 00:00:00.000",
+            "Path": ("test_pool",),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_entity_data():
-    """Sample entity data for testing."""
-    return {
-        "Name": "test_entity",
-        "IsLeaf": True,
-    }
+    """Read-only sample entity data shared across the session."""
+    return MappingProxyType(
+        {
+            "Name": "test_entity",
+            "IsLeaf": True,
+        }
+    )
 
 
 @pytest.fixture
 def mock_describe_result():
-    """Mock DESCRIBE query result."""
+    """Mock DESCRIBE query result, shared between tests with the same data."""
 
-    def _mock_describe(resource_type: str, data: Dict[str, Any]):
-        mock_rows = AsyncMock()
+    def _mock_describe(resource_type: str, data: Mapping[str, Any]) -> StubRows:
+        return describe_result(data)
 
-        # Convert data to DESCRIBE format (key-value pairs)
-        describe_data = [[k, str(v)] for k, v in data.items()]
+    return _mock_describe
 
-        mock_column1 = MagicMock()
-        mock_column1.name = "property"
-        mock_column2 = MagicMock()
-        mock_column2.name = "value"
 
-        mock_rows.columns = lambda: [mock_column1, mock_column2]
+@pytest.fixture
+def prime_get(mock_connection, sample_entity_data):
+    """Prime the DESCRIBE result that ``create()`` reads back for an entity."""
 
-        async def mock_iter(self):
-            for row in describe_data:
-                yield row
+    def _prime(name: str) -> None:
+        mock_connection.query.return_value = describe_result(
+            with_name(sample_entity_data, name)
+        )
 
-        mock_rows.__aiter__ = mock_iter
-        return mock_rows
-
-    return _mock_describe
+    return _prime
 
 
 @pytest.fixture
 def mock_list_result():
-    """Mock LIST query result."""
-
-    def _mock_list(items: List[str]):
-        mock_rows = AsyncMock()
-
-        mock_column = MagicMock()
-        mock_column.name = "Name"
-        mock_rows.columns = lambda: [mock_column]
-
-        async def mock_iter(self):
-            for item in items:
-                yield [item]  # Yield as list, not dict
+    """Mock LIST query result, shared between tests listing the same names."""
 
-        mock_rows.__aiter__ = mock_iter
-        return mock_rows
+    def _mock_list(items: List[str]) -> StubRows:
+        return _list_rows(tuple(items))
 
     return _mock_list
 
@@ -2,134 +2,495 @@
 Tests for SDK resource managers.
 """
 
+from typing import Final
+
 import pytest
-from unittest.mock import AsyncMock
 
-from deltastream_sdk.resources import (
-    StreamManager,
-    StoreManager,
-    DatabaseManager,
-    ComputePoolManager,
+from deltastream_sdk.resources import BaseResourceManager
+from deltastream_sdk.models import (
+    Stream,
+    Database,
+    ComputePool,
+    StreamUpdateParams,
+    ComputePoolUpdateParams,
+)
+from deltastream_sdk.exceptions import ResourceNotFound, SQLError
+
+from .conftest import (
+    StubRows,
+    assert_contains_all,
+    assert_exec_contains,
+    assert_exec_sql,
+    canonicalize_sql,
+    joined_exec_sql,
+    last_exec_sql,
+    with_name,
+)
+
+# Query result with no columns and no rows, shared by not-found tests
+_EMPTY_ROWS = StubRows((), ())
+
+# Expected SQL with WITH (...) parameters sorted by key, see canonicalize_sql
+GOLDEN_CREATE_STREAM_WITH_SCHEMA = (
+    'CREATE STREAM "test_stream" ("id" INTEGER, "message" VARCHAR) '
+    "WITH ('store' = 'kafka_store', 'topic' = 'test_topic', "
+    "'value.format' = 'JSON');"
+)
+GOLDEN_CREATE_STREAM_FROM_SELECT = (
+    'CREATE STREAM "derived_stream" AS SELECT * FROM source_stream '
+    "WITH ('store' = 'kafka_store', 'topic' = 'derived_topic');"
+)
+GOLDEN_CREATE_KAFKA_STORE = (
+    'CREATE STORE "kafka_store" '
+    "WITH ('kafka.sasl.hash_function' = PLAIN, 'kafka.sasl.password' = 'pass', "
+    "'kafka.sasl.username' = 'user', 'type' = KAFKA, 'uris' = 'localhost:9092');"
+)
+GOLDEN_CREATE_KINESIS_STORE = (
+    'CREATE STORE "kinesis_store" '
+    "WITH ('kinesis.access_key_id' = 'ACCESS_KEY', "
+    "'kinesis.secret_access_key' = 'SECRET_KEY', 'type' = KINESIS, "
+    "'uris' = 'https://kinesis.us-east-1.amazonaws.com');"
+)
+GOLDEN_CREATE_S3_STORE = (
+    'CREATE STORE "s3_store" '
+    "WITH ('aws.access_key_id' = 'ACCESS_KEY', "
+    "'aws.secret_access_key' = 'SECRET_KEY', 'type' = S3, "
+    "'uris' = 'https://mybucket.s3.us-west-2.amazonaws.com/');"
+)
+GOLDEN_CREATE_COMPUTE_POOL = (
+    'CREATE COMPUTE_POOL "test_pool" '
+    "WITH ('auto.suspend' = 'true', 'auto.suspend.minutes' = '15', "
+    "'max.units' = '5', 'min.units' = '1', 'size' = 'MEDIUM');"
+)
+GOLDEN_UPDATE_COMPUTE_POOL = (
+    'UPDATE COMPUTE_POOL "test_pool" '
+    "WITH ('auto.suspend.minutes' = '30', 'max.units' = '10', 'min.units' = '2');"
+)
+
+# (create method, store name, parameters, golden SQL) rows
+STORE_CASES = (
+    pytest.param(
+        "create_kafka_store",
+        "kafka_store",
+        {
+            "uris": "localhost:9092",
+            "kafka.sasl.hash_function": "PLAIN",
+            "kafka.sasl.username": "user",
+            "kafka.sasl.password": "pass",
+        },
+        GOLDEN_CREATE_KAFKA_STORE,
+        id="kafka",
+    ),
+    pytest.param(
+        "create_kinesis_store",
+        "kinesis_store",
+        {
+            "uris": "https://kinesis.us-east-1.amazonaws.com",
+            "kinesis.access_key_id": "ACCESS_KEY",
+            "kinesis.secret_access_key": "SECRET_KEY",
+        },
+        GOLDEN_CREATE_KINESIS_STORE,
+        id="kinesis",
+    ),
+    pytest.param(
+        "create_s3_store",
+        "s3_store",
+        {
+            "uris": "https://mybucket.s3.us-west-2.amazonaws.com/",
+            "aws.access_key_id": "ACCESS_KEY",
+            "aws.secret_access_key": "SECRET_KEY",
+        },
+        GOLDEN_CREATE_S3_STORE,
+        id="s3",
+    ),
 )
-from deltastream_sdk.models import Stream, Database, ComputePool
-from deltastream_sdk.exceptions import ResourceNotFound
+
+# Expected single statements; lifecycle builders omit the trailing semicolon
+# that _execute_sql appends
+SQL_CREATE_STREAM_TEST: Final = "CREATE STREAM test;"
+SQL_LIST_STREAMS: Final = "LIST STREAMS;"
+SQL_DESCRIBE_STREAM: Final = 'DESCRIBE RELATION "test_stream";'
+SQL_TEST_STORE: Final = 'TEST STORE "test_store";'
+SQL_DESCRIBE_DATABASE: Final = 'DESCRIBE DATABASE "test_database";'
+SQL_UPDATE_DATABASE_NOOP: Final = '-- No updates specified for database "test_db";'
+SQL_DESCRIBE_COMPUTE_POOL: Final = 'DESCRIBE COMPUTE_POOL "test_pool";'
+SQL_START_STREAM: Final = 'START STREAM "test_stream"'
+SQL_STOP_STREAM: Final = 'STOP STREAM "test_stream"'
+SQL_DROP_STREAM: Final = 'DROP STREAM "test_stream"'
+SQL_START_COMPUTE_POOL: Final = 'START COMPUTE_POOL "test_pool"'
+SQL_STOP_COMPUTE_POOL: Final = 'STOP COMPUTE_POOL "test_pool"'
+SQL_DROP_COMPUTE_POOL: Final = 'DROP COMPUTE_POOL "test_pool"'
+SQL_DROP_DATABASE: Final = 'DROP DATABASE "test_db"'
+SQL_DROP_STORE: Final = 'DROP STORE "test_store"'
+SQL_DROP_ENTITY: Final = 'DROP ENTITY "test_entity"'
+# The same lifecycle statements as executed, with the trailing semicolon
+SQL_START_STREAM_STMT: Final = f"{SQL_START_STREAM};"
+SQL_STOP_STREAM_STMT: Final = f"{SQL_STOP_STREAM};"
+SQL_DROP_STREAM_STMT: Final = f"{SQL_DROP_STREAM};"
+SQL_START_COMPUTE_POOL_STMT: Final = f"{SQL_START_COMPUTE_POOL};"
+SQL_STOP_COMPUTE_POOL_STMT: Final = f"{SQL_STOP_COMPUTE_POOL};"
+
+# (manager fixture, builder or method, name, expected SQL) rows
+LIFECYCLE_BUILDER_CASES = (
+    pytest.param(
+        "stream_manager",
+        "_get_start_sql",
+        "test_stream",
+        SQL_START_STREAM,
+        id="start_stream",
+    ),
+    pytest.param(
+        "stream_manager",
+        "_get_stop_sql",
+        "test_stream",
+        SQL_STOP_STREAM,
+        id="stop_stream",
+    ),
+    pytest.param(
+        "stream_manager",
+        "_get_delete_sql",
+        "test_stream",
+        SQL_DROP_STREAM,
+        id="delete_stream",
+    ),
+    pytest.param(
+        "compute_pool_manager",
+        "_get_start_sql",
+        "test_pool",
+        SQL_START_COMPUTE_POOL,
+        id="start_compute_pool",
+    ),
+    pytest.param(
+        "compute_pool_manager",
+        "_get_stop_sql",
+        "test_pool",
+        SQL_STOP_COMPUTE_POOL,
+        id="stop_compute_pool",
+    ),
+    pytest.param(
+        "compute_pool_manager",
+        "_get_delete_sql",
+        "test_pool",
+        SQL_DROP_COMPUTE_POOL,
+        id="delete_compute_pool",
+    ),
+    pytest.param(
+        "database_manager",
+        "_get_delete_sql",
+        "test_db",
+        SQL_DROP_DATABASE,
+        id="delete_database",
+    ),
+    pytest.param(
+        "store_manager",
+        "_get_delete_sql",
+        "test_store",
+        SQL_DROP_STORE,
+        id="delete_store",
+    ),
+    pytest.param(
+        "entity_manager",
+        "_get_delete_sql",
+        "test_entity",
+        SQL_DROP_ENTITY,
+        id="delete_entity",
+    ),
+)
+LIFECYCLE_EXEC_CASES = (
+    pytest.param(
+        "stream_manager",
+        "start",
+        "test_stream",
+        SQL_START_STREAM_STMT,
+        id="start_stream",
+    ),
+    pytest.param(
+        "stream_manager", "stop", "test_stream", SQL_STOP_STREAM_STMT, id="stop_stream"
+    ),
+    pytest.param(
+        "stream_manager",
+        "delete",
+        "test_stream",
+        SQL_DROP_STREAM_STMT,
+        id="delete_stream",
+    ),
+    pytest.param(
+        "compute_pool_manager",
+        "start",
+        "test_pool",
+        SQL_START_COMPUTE_POOL_STMT,
+        id="start_compute_pool",
+    ),
+    pytest.param(
+        "compute_pool_manager",
+        "stop",
+        "test_pool",
+        SQL_STOP_COMPUTE_POOL_STMT,
+        id="stop_compute_pool",
+    ),
+)
+
+
+# (name, store, params, required fragments, forbidden fragments) rows
+ENTITY_CREATE_CASES = (
+    pytest.param(
+        "pv",
+        None,
+        None,
+        ('CREATE ENTITY "pv"',),
+        ("IN STORE", "WITH"),
+        id="defaults",
+    ),
+    pytest.param(
+        "pv",
+        "demostore",
+        None,
+        ('CREATE ENTITY "pv"', 'IN STORE "demostore"'),
+        (),
+        id="with_store",
+    ),
+    pytest.param(
+        "customers",
+        "kafka_store",
+        {
+            "topic.partitions": "1",
+            "topic.replicas": "2",
+            "kafka.topic.retention.ms": "172800000",
+        },
+        (
+            'CREATE ENTITY "customers"',
+            'IN STORE "kafka_store"',
+            "WITH (",
+            "'topic.partitions' = '1'",
+            "'topic.replicas' = '2'",
+            "'kafka.topic.retention.ms' = '172800000'",
+        ),
+        (),
+        id="kafka_passthrough_config",
+    ),
+    pytest.param(
+        "pv_compact",
+        None,
+        {
+            "topic.partitions": "2",
+            "topic.replicas": "1",
+            "kafka.topic.cleanup.policy": "compact",
+        },
+        (
+            'CREATE ENTITY "pv_compact"',
+            "WITH (",
+            "'topic.partitions' = '2'",
+            "'topic.replicas' = '1'",
+            "'kafka.topic.cleanup.policy' = 'compact'",
+        ),
+        ("IN STORE",),
+        id="kafka_cleanup_policy",
+    ),
+    pytest.param(
+        "pv_pb",
+        None,
+        {
+            "key.descriptor": 'pb_key."PageviewsKey"',
+            "value.descriptor": 'pb_value."Pageviews"',
+        },
+        (
+            'CREATE ENTITY "pv_pb"',
+            "WITH (",
+            "'key.descriptor' = 'pb_key.\"PageviewsKey\"'",
+            "'value.descriptor' = 'pb_value.\"Pageviews\"'",
+        ),
+        ("IN STORE",),
+        id="protobuf_descriptors",
+    ),
+    pytest.param(
+        "pv_kinesis",
+        "kinesis_store",
+        {"kinesis.shards": "3"},
+        (
+            'CREATE ENTITY "pv_kinesis"',
+            'IN STORE "kinesis_store"',
+            "WITH (",
+            "'kinesis.shards' = '3'",
+        ),
+        (),
+        id="kinesis_shards",
+    ),
+)
+
+
+# (entity name, expected quoted CREATE ENTITY fragment) rows
+ENTITY_NAME_CASES = (
+    pytest.param(
+        "DELTA_STREAMING", 'CREATE ENTITY "DELTA_STREAMING"', id="sf_database"
+    ),
+    pytest.param(
+        "DELTA_STREAMING.MY_STREAMING_SCHEMA",
+        'CREATE ENTITY "DELTA_STREAMING.MY_STREAMING_SCHEMA"',
+        id="sf_schema",
+    ),
+    pytest.param("cat1", 'CREATE ENTITY "cat1"', id="db_catalog"),
+    pytest.param("cat1.schema1", 'CREATE ENTITY "cat1.schema1"', id="db_schema"),
+    pytest.param(
+        'entity"with"quotes',
+        'CREATE ENTITY "entity""with""quotes"',
+        id="escape_quotes",
+    ),
+)
+
+
+# Every entity parameter at once, and the fragments its CREATE must contain
+COMPLEX_ENTITY_PARAMS: Final = {
+    "topic.partitions": "3",
+    "topic.replicas": "2",
+    "kafka.topic.retention.ms": "604800000",
+    "kafka.topic.cleanup.policy": "delete",
+    "key.descriptor": "pb_key.MyKey",
+    "value.descriptor": "pb_value.MyValue",
+}
+COMPLEX_ENTITY_EXPECTED: Final = (
+    'CREATE ENTITY "complex_entity"',
+    'IN STORE "kafka_store"',
+    "WITH (",
+    "'topic.partitions' = '3'",
+    "'topic.replicas' = '2'",
+    "'kafka.topic.retention.ms' = '604800000'",
+    "'kafka.topic.cleanup.policy' = 'delete'",
+    "'key.descriptor' = 'pb_key.MyKey'",
+    "'value.descriptor' = 'pb_value.MyValue'",
+)
+
+
+@pytest.fixture
+def mock_connection(stub_connection):
+    """Resource managers only await exec/query, so use the lightweight stub."""
+    return stub_connection
 
 
 class TestBaseResourceManager:
     """Test BaseResourceManager functionality."""
 
-    @pytest.mark.asyncio
-    async def test_execute_sql(self, mock_connection):
+    async def test_execute_sql(self, stream_manager, mock_connection):
         """Test _execute_sql method."""
-        manager = StreamManager(mock_connection)
-
-        await manager._execute_sql("CREATE STREAM test")
+        await stream_manager._execute_sql("CREATE STREAM test")
 
-        mock_connection.exec.assert_called_once_with("CREATE STREAM test;")
+        assert_exec_sql(mock_connection, SQL_CREATE_STREAM_TEST)
 
-    @pytest.mark.asyncio
-    async def test_query_sql(self, mock_connection, mock_query_rows):
+    async def test_query_sql(self, stream_manager, mock_connection, mock_query_rows):
         """Test _query_sql method."""
-        manager = StreamManager(mock_connection)
         mock_connection.query.return_value = mock_query_rows
 
-        result = await manager._query_sql("LIST STREAMS")
+        result = await stream_manager._query_sql("LIST STREAMS")
 
-        mock_connection.query.assert_called_once_with("LIST STREAMS;")
+        mock_connection.query.assert_called_once_with(SQL_LIST_STREAMS)
         assert result == [{"name": "test_stream"}, {"name": "another_stream"}]
 
-    def test_escape_identifier(self, mock_connection):
+    @pytest.mark.parametrize(
+        "identifier, expected",
+        [
+            ("test_stream", '"test_stream"'),
+            # Identifier with special characters
+            ("test-stream", '"test-stream"'),
+            # Identifier with quotes (should be escaped)
+            ('test"stream', '"test""stream"'),
+        ],
+    )
+    def test_escape_identifier(self, identifier, expected):
         """Test SQL identifier escaping."""
-        manager = StreamManager(mock_connection)
+        assert BaseResourceManager._escape_identifier(identifier) == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("test value", "'test value'"),
+            # String with single quotes (should be escaped)
+            ("test's value", "'test''s value'"),
+            ("", "''"),
+        ],
+    )
+    def test_escape_string(self, value, expected):
+        """Test SQL string escaping."""
+        assert BaseResourceManager._escape_string(value) == expected
 
-        # Normal identifier
-        assert manager._escape_identifier("test_stream") == '"test_stream"'
 
-        # Identifier with special characters
-        assert manager._escape_identifier("test-stream") == '"test-stream"'
+class TestBaseResourceManagerBenchmarks:
+    """Benchmark the SQL execution hot paths shared by every manager.
 
-        # Identifier with quotes (should be escaped)
-        assert manager._escape_identifier('test"stream') == '"test""stream"'
+    Timed only with ``--benchmark-enable`` (see ``make benchmark``);
+    otherwise each benchmark runs once as a regular test.
+    """
 
-    def test_escape_string(self, mock_connection):
-        """Test SQL string escaping."""
-        manager = StreamManager(mock_connection)
+    def test_execute_sql_benchmark(
+        self, stream_manager, aio_benchmark, mock_connection
+    ):
+        """Benchmark _execute_sql statement building and dispatch."""
+        aio_benchmark(stream_manager._execute_sql, "CREATE STREAM test")
 
-        # Normal string
-        assert manager._escape_string("test value") == "'test value'"
+        assert last_exec_sql(mock_connection) == SQL_CREATE_STREAM_TEST
 
-        # String with single quotes (should be escaped)
-        assert manager._escape_string("test's value") == "'test''s value'"
+    def test_query_sql_benchmark(
+        self, stream_manager, aio_benchmark, mock_connection, mock_query_rows
+    ):
+        """Benchmark _query_sql including row conversion."""
+        mock_connection.query.return_value = mock_query_rows
 
-        # Empty string
-        assert manager._escape_string("") == "''"
+        result = aio_benchmark(stream_manager._query_sql, "LIST STREAMS")
+
+        assert result == [{"name": "test_stream"}, {"name": "another_stream"}]
+
+    def test_escape_identifier_benchmark(self, aio_benchmark):
+        """Benchmark SQL identifier escaping."""
+        result = aio_benchmark(BaseResourceManager._escape_identifier, 'test"stream')
+
+        assert result == '"test""stream"'
 
 
 class TestStreamManager:
     """Test StreamManager."""
 
-    @pytest.mark.asyncio
-    async def test_list_streams(self, mock_connection, mock_list_result):
+    async def test_list_streams(
+        self, stream_manager, mock_connection, mock_list_result
+    ):
         """Test listing streams."""
-        manager = StreamManager(mock_connection)
         mock_connection.query.return_value = mock_list_result(["stream1", "stream2"])
 
-        streams = await manager.list()
+        streams = await stream_manager.list()
 
-        mock_connection.query.assert_called_once_with("LIST STREAMS;")
+        mock_connection.query.assert_called_once_with(SQL_LIST_STREAMS)
         assert len(streams) == 2
         assert streams[0].name == "stream1"
         assert streams[1].name == "stream2"
 
-    @pytest.mark.asyncio
     async def test_get_stream(
-        self, mock_connection, mock_describe_result, sample_stream_data
+        self, stream_manager, mock_connection, mock_describe_result, sample_stream_data
     ):
         """Test getting a specific stream."""
-        manager = StreamManager(mock_connection)
         mock_connection.query.return_value = mock_describe_result(
             "STREAM", sample_stream_data
         )
 
-        stream = await manager.get("test_stream")
+        stream = await stream_manager.get("test_stream")
 
-        expected_sql = 'DESCRIBE RELATION "test_stream";'
-        mock_connection.query.assert_called_once_with(expected_sql)
+        mock_connection.query.assert_called_once_with(SQL_DESCRIBE_STREAM)
         assert isinstance(stream, Stream)
         assert stream.name == "test_stream"
 
-    @pytest.mark.asyncio
-    async def test_get_stream_not_found(self, mock_connection):
+    async def test_get_stream_not_found(self, stream_manager, mock_connection):
         """Test getting non-existent stream raises exception."""
-        manager = StreamManager(mock_connection)
-
-        # Mock empty result
-        mock_rows = AsyncMock()
-        mock_rows.columns = lambda: []
-
-        async def empty_iter(self):
-            return
-            yield  # This will never execute
-
-        mock_rows.__aiter__ = empty_iter
-        mock_connection.query.return_value = mock_rows
+        mock_connection.query.return_value = _EMPTY_ROWS
 
         with pytest.raises(ResourceNotFound):
-            await manager.get("nonexistent_stream")
+            await stream_manager.get("nonexistent_stream")
 
-    @pytest.mark.asyncio
     async def test_create_stream_with_schema(
-        self, mock_connection, mock_describe_result, sample_stream_data
+        self, stream_manager, mock_connection, mock_describe_result, sample_stream_data
     ):
         """Test creating stream with explicit schema."""
-        manager = StreamManager(mock_connection)
-
         # Mock the query call for get() after creation
         mock_connection.query.return_value = mock_describe_result(
             "stream", sample_stream_data
         )
 
-        await manager.create_with_schema(
+        stream = await stream_manager.create_with_schema(
             name="test_stream",
             columns=[
                 {"name": "id", "type": "INTEGER"},
@@ -141,326 +502,195 @@ class TestStreamManager:
         )
 
         # Verify SQL generation
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE STREAM "test_stream"' in call_args
-        assert '"id" INTEGER' in call_args
-        assert '"message" VARCHAR' in call_args
-        assert "'store' = 'kafka_store'" in call_args
-        assert "'topic' = 'test_topic'" in call_args
-        assert "'value.format' = 'JSON'" in call_args
-
-    @pytest.mark.asyncio
+        assert (
+            canonicalize_sql(last_exec_sql(mock_connection))
+            == GOLDEN_CREATE_STREAM_WITH_SCHEMA
+        )
+        # The created stream is fetched back with DESCRIBE
+        mock_connection.query.assert_called_once_with(SQL_DESCRIBE_STREAM)
+        assert isinstance(stream, Stream)
+        assert stream.name == "test_stream"
+
     async def test_create_stream_from_select(
-        self, mock_connection, mock_describe_result, sample_stream_data
+        self, stream_manager, mock_connection, mock_describe_result, sample_stream_data
     ):
         """Test creating stream from SELECT query."""
-        manager = StreamManager(mock_connection)
-
         # Mock the query call for get() after creation
-        derived_stream_data = sample_stream_data.copy()
-        derived_stream_data["name"] = "derived_stream"
         mock_connection.query.return_value = mock_describe_result(
-            "stream", derived_stream_data
+            "stream", with_name(sample_stream_data, "derived_stream")
         )
 
-        await manager.create_from_select(
+        await stream_manager.create_from_select(
             name="derived_stream",
             sql_definition="SELECT * FROM source_stream",
             store="kafka_store",
             topic="derived_topic",
         )
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE STREAM "derived_stream"' in call_args
-        assert "AS SELECT * FROM source_stream" in call_args
-        assert "'store' = 'kafka_store'" in call_args
-        assert "'topic' = 'derived_topic'" in call_args
+        assert (
+            canonicalize_sql(last_exec_sql(mock_connection))
+            == GOLDEN_CREATE_STREAM_FROM_SELECT
+        )
 
-    @pytest.mark.asyncio
-    async def test_update_stream(
-        self, mock_connection, mock_describe_result, sample_stream_data
-    ):
+    async def test_update_stream(self, stream_manager):
         """Test that updating stream raises SQLError with InvalidConfiguration."""
-        manager = StreamManager(mock_connection)
-
-        from deltastream_sdk.models import StreamUpdateParams
-        from deltastream_sdk.exceptions import SQLError
-
         params = StreamUpdateParams()
 
         with pytest.raises(SQLError, match="Stream updates are limited"):
-            await manager.update("test_stream", params)
-
-    @pytest.mark.asyncio
-    async def test_delete_stream(self, mock_connection):
-        """Test deleting stream."""
-        manager = StreamManager(mock_connection)
-
-        await manager.delete("test_stream")
-
-        expected_sql = 'DROP STREAM "test_stream";'
-        mock_connection.exec.assert_called_once_with(expected_sql)
-
-    @pytest.mark.asyncio
-    async def test_exists_stream_true(self, mock_connection, mock_list_result):
-        """Test stream exists check (true case)."""
-        manager = StreamManager(mock_connection)
-        mock_connection.query.return_value = mock_list_result(["test_stream"])
-
-        exists = await manager.exists("test_stream")
-
-        assert exists is True
-
-    @pytest.mark.asyncio
-    async def test_exists_stream_false(self, mock_connection, mock_list_result):
-        """Test stream exists check (false case)."""
-        manager = StreamManager(mock_connection)
-        mock_connection.query.return_value = mock_list_result([])
-
-        exists = await manager.exists("nonexistent_stream")
-
-        assert exists is False
-
-    @pytest.mark.asyncio
-    async def test_start_stream(self, mock_connection):
-        """Test starting stream."""
-        manager = StreamManager(mock_connection)
-
-        await manager.start("test_stream")
-
-        expected_sql = 'START STREAM "test_stream";'
-        mock_connection.exec.assert_called_once_with(expected_sql)
-
-    @pytest.mark.asyncio
-    async def test_stop_stream(self, mock_connection):
-        """Test stopping stream."""
-        manager = StreamManager(mock_connection)
+            await stream_manager.update("test_stream", params)
+
+    @pytest.mark.parametrize(
+        "listed, name, expected",
+        [
+            (["test_stream"], "test_stream", True),
+            ([], "nonexistent_stream", False),
+        ],
+        ids=["exists", "missing"],
+    )
+    async def test_exists_stream(
+        self, stream_manager, mock_connection, mock_list_result, listed, name, expected
+    ):
+        """Test stream exists check."""
+        mock_connection.query.return_value = mock_list_result(listed)
 
-        await manager.stop("test_stream")
+        exists = await stream_manager.exists(name)
 
-        expected_sql = 'STOP STREAM "test_stream";'
-        mock_connection.exec.assert_called_once_with(expected_sql)
+        assert exists is expected
 
 
 class TestStoreManager:
     """Test StoreManager."""
 
-    @pytest.mark.asyncio
-    async def test_create_kafka_store(
-        self, mock_connection, mock_describe_result, sample_store_data
+    @pytest.mark.parametrize("method, name, parameters, golden", STORE_CASES)
+    async def test_create_store(
+        self,
+        store_manager,
+        mock_connection,
+        mock_describe_result,
+        sample_store_data,
+        method,
+        name,
+        parameters,
+        golden,
     ):
-        """Test creating Kafka store."""
-        manager = StoreManager(mock_connection)
-
+        """Test creating each store type."""
         # Mock the query call for get() after creation
-        kafka_store_data = sample_store_data.copy()
-        kafka_store_data["name"] = "kafka_store"
         mock_connection.query.return_value = mock_describe_result(
-            "store", kafka_store_data
-        )
-
-        await manager.create_kafka_store(
-            name="kafka_store",
-            parameters={
-                "uris": "localhost:9092",
-                "kafka.sasl.hash_function": "PLAIN",
-                "kafka.sasl.username": "user",
-                "kafka.sasl.password": "pass",
-            },
+            "store", with_name(sample_store_data, name)
         )
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE STORE "kafka_store"' in call_args
-        assert "'type' = KAFKA" in call_args
-        assert "'uris' = 'localhost:9092'" in call_args
-        assert "'kafka.sasl.hash_function' = PLAIN" in call_args
-        assert "'kafka.sasl.username' = 'user'" in call_args
-        assert "'kafka.sasl.password' = 'pass'" in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_kinesis_store(
-        self, mock_connection, mock_describe_result, sample_store_data
-    ):
-        """Test creating Kinesis store."""
-        manager = StoreManager(mock_connection)
+        await getattr(store_manager, method)(name=name, parameters=parameters)
 
-        # Mock the query call for get() after creation
-        kinesis_store_data = sample_store_data.copy()
-        kinesis_store_data["name"] = "kinesis_store"
-        mock_connection.query.return_value = mock_describe_result(
-            "store", kinesis_store_data
-        )
+        assert canonicalize_sql(last_exec_sql(mock_connection)) == golden
 
-        await manager.create_kinesis_store(
-            name="kinesis_store",
-            parameters={
-                "uris": "https://kinesis.us-east-1.amazonaws.com",
-                "kinesis.access_key_id": "ACCESS_KEY",
-                "kinesis.secret_access_key": "SECRET_KEY",
-            },
-        )
-
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE STORE "kinesis_store"' in call_args
-        assert "'type' = KINESIS" in call_args
-        assert "'uris' = 'https://kinesis.us-east-1.amazonaws.com'" in call_args
-        assert "'kinesis.access_key_id' = 'ACCESS_KEY'" in call_args
-        assert "'kinesis.secret_access_key' = 'SECRET_KEY'" in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_s3_store(
-        self, mock_connection, mock_describe_result, sample_store_data
+    async def test_test_connection(
+        self, store_manager, mock_connection, mock_query_rows
     ):
-        """Test creating S3 store."""
-        manager = StoreManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        s3_store_data = sample_store_data.copy()
-        s3_store_data["name"] = "s3_store"
-        mock_connection.query.return_value = mock_describe_result(
-            "store", s3_store_data
-        )
-
-        await manager.create_s3_store(
-            name="s3_store",
-            parameters={
-                "uris": "https://mybucket.s3.us-west-2.amazonaws.com/",
-                "aws.access_key_id": "ACCESS_KEY",
-                "aws.secret_access_key": "SECRET_KEY",
-            },
-        )
-
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE STORE "s3_store"' in call_args
-        assert "'type' = S3" in call_args
-        assert "'uris' = 'https://mybucket.s3.us-west-2.amazonaws.com/'" in call_args
-        assert "'aws.access_key_id' = 'ACCESS_KEY'" in call_args
-        assert "'aws.secret_access_key' = 'SECRET_KEY'" in call_args
-
-    @pytest.mark.asyncio
-    async def test_test_connection(self, mock_connection, mock_query_rows):
         """Test testing store connection."""
-        manager = StoreManager(mock_connection)
-
         # Mock the query result for test connection
         mock_connection.query.return_value = mock_query_rows
 
-        result = await manager.test_connection("test_store")
+        result = await store_manager.test_connection("test_store")
 
-        expected_sql = 'TEST STORE "test_store";'
-        mock_connection.query.assert_called_once_with(expected_sql)
+        mock_connection.query.assert_called_once_with(SQL_TEST_STORE)
         assert result == {"name": "test_stream"}
 
 
 class TestDatabaseManager:
     """Test DatabaseManager."""
 
-    @pytest.mark.asyncio
     async def test_create_database(
-        self, mock_connection, mock_describe_result, sample_database_data
+        self,
+        database_manager,
+        mock_connection,
+        mock_describe_result,
+        sample_database_data,
     ):
         """Test creating database."""
-        manager = DatabaseManager(mock_connection)
-
         # Mock the query call for get() after creation
-        test_db_data = sample_database_data.copy()
-        test_db_data["Name"] = "test_db"  # Use PascalCase for API field names
         mock_connection.query.return_value = mock_describe_result(
-            "database", test_db_data
+            "database", with_name(sample_database_data, "test_db")
         )
 
         # Note: comment parameter is ignored as it's not supported by DeltaStream API
-        await manager.create(name="test_db")
+        await database_manager.create(name="test_db")
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE DATABASE "test_db"' in call_args
+        assert_exec_contains(mock_connection, 'CREATE DATABASE "test_db"')
 
-    @pytest.mark.asyncio
     async def test_create_database_minimal(
-        self, mock_connection, mock_describe_result, sample_database_data
+        self,
+        database_manager,
+        mock_connection,
+        mock_describe_result,
+        sample_database_data,
     ):
         """Test creating database with minimal parameters."""
-        manager = DatabaseManager(mock_connection)
-
         # Mock the query call for get() after creation
-        minimal_db_data = sample_database_data.copy()
-        minimal_db_data["name"] = "minimal_db"
         mock_connection.query.return_value = mock_describe_result(
-            "database", minimal_db_data
+            "database", with_name(sample_database_data, "minimal_db")
         )
 
-        await manager.create(name="minimal_db")
+        await database_manager.create(name="minimal_db")
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE DATABASE "minimal_db"' in call_args
+        call_args = assert_exec_contains(
+            mock_connection, 'CREATE DATABASE "minimal_db"'
+        )
         # Should not contain WITH clause if no optional params
         assert "WITH" not in call_args
 
-    @pytest.mark.asyncio
     async def test_get_database(
-        self, mock_connection, mock_describe_result, sample_database_data
+        self,
+        database_manager,
+        mock_connection,
+        mock_describe_result,
+        sample_database_data,
     ):
         """Test getting database."""
-        manager = DatabaseManager(mock_connection)
         mock_connection.query.return_value = mock_describe_result(
             "DATABASE", sample_database_data
         )
 
-        database = await manager.get("test_database")
+        database = await database_manager.get("test_database")
 
-        expected_sql = 'DESCRIBE DATABASE "test_database";'
-        mock_connection.query.assert_called_once_with(expected_sql)
+        mock_connection.query.assert_called_once_with(SQL_DESCRIBE_DATABASE)
         assert isinstance(database, Database)
         assert database.name == "test_database"
 
-    @pytest.mark.asyncio
     async def test_update_database(
-        self, mock_connection, mock_describe_result, sample_database_data
+        self,
+        database_manager,
+        mock_connection,
+        mock_describe_result,
+        sample_database_data,
     ):
         """Test updating database (no updates supported, should execute comment SQL)."""
-        manager = DatabaseManager(mock_connection)
-
         # Mock the query call for get() after update
-        test_db_data = sample_database_data.copy()
-        test_db_data["name"] = "test_db"
         mock_connection.query.return_value = mock_describe_result(
-            "database", test_db_data
+            "database", with_name(sample_database_data, "test_db")
         )
 
-        await manager.update("test_db")
-
-        expected_sql = '-- No updates specified for database "test_db";'
-        mock_connection.exec.assert_called_once_with(expected_sql)
-
-    @pytest.mark.asyncio
-    async def test_delete_database(self, mock_connection):
-        """Test deleting database."""
-        manager = DatabaseManager(mock_connection)
-
-        await manager.delete("test_db")
+        await database_manager.update("test_db")
 
-        expected_sql = 'DROP DATABASE "test_db";'
-        mock_connection.exec.assert_called_once_with(expected_sql)
+        assert_exec_sql(mock_connection, SQL_UPDATE_DATABASE_NOOP)
 
 
 class TestComputePoolManager:
     """Test ComputePoolManager."""
 
-    @pytest.mark.asyncio
     async def test_create_compute_pool(
-        self, mock_connection, mock_describe_result, sample_compute_pool_data
+        self,
+        compute_pool_manager,
+        mock_connection,
+        mock_describe_result,
+        sample_compute_pool_data,
     ):
         """Test creating compute pool."""
-        manager = ComputePoolManager(mock_connection)
-
         # Mock the query call for get() after creation
-        test_pool_data = sample_compute_pool_data.copy()
-        test_pool_data["name"] = "test_pool"
         mock_connection.query.return_value = mock_describe_result(
-            "compute_pool", test_pool_data
+            "compute_pool", sample_compute_pool_data
         )
 
-        await manager.create(
+        await compute_pool_manager.create(
             name="test_pool",
             size="MEDIUM",
             min_units=1,
@@ -469,90 +699,88 @@ class TestComputePoolManager:
             auto_suspend_minutes=15,
         )
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE COMPUTE_POOL "test_pool"' in call_args
-        assert "'size' = 'MEDIUM'" in call_args
-        assert "'min.units' = '1'" in call_args
-        assert "'max.units' = '5'" in call_args
-        assert "'auto.suspend' = 'true'" in call_args
-        assert "'auto.suspend.minutes' = '15'" in call_args
-
-    @pytest.mark.asyncio
-    async def test_start_compute_pool(self, mock_connection):
-        """Test starting compute pool."""
-        manager = ComputePoolManager(mock_connection)
-
-        await manager.start("test_pool")
-
-        expected_sql = 'START COMPUTE_POOL "test_pool";'
-        mock_connection.exec.assert_called_once_with(expected_sql)
-
-    @pytest.mark.asyncio
-    async def test_stop_compute_pool(self, mock_connection):
-        """Test stopping compute pool."""
-        manager = ComputePoolManager(mock_connection)
-
-        await manager.stop("test_pool")
-
-        expected_sql = 'STOP COMPUTE_POOL "test_pool";'
-        mock_connection.exec.assert_called_once_with(expected_sql)
+        assert (
+            canonicalize_sql(last_exec_sql(mock_connection))
+            == GOLDEN_CREATE_COMPUTE_POOL
+        )
 
-    @pytest.mark.asyncio
     async def test_get_compute_pool(
-        self, mock_connection, mock_describe_result, sample_compute_pool_data
+        self,
+        compute_pool_manager,
+        mock_connection,
+        mock_describe_result,
+        sample_compute_pool_data,
     ):
         """Test getting compute pool."""
-        manager = ComputePoolManager(mock_connection)
         mock_connection.query.return_value = mock_describe_result(
             "COMPUTE_POOL", sample_compute_pool_data
         )
 
-        pool = await manager.get("test_pool")
+        pool = await compute_pool_manager.get("test_pool")
 
-        expected_sql = 'DESCRIBE COMPUTE_POOL "test_pool";'
-        mock_connection.query.assert_called_once_with(expected_sql)
+        mock_connection.query.assert_called_once_with(SQL_DESCRIBE_COMPUTE_POOL)
         assert isinstance(pool, ComputePool)
         assert pool.name == "test_pool"
 
-    @pytest.mark.asyncio
     async def test_update_compute_pool(
-        self, mock_connection, mock_describe_result, sample_compute_pool_data
+        self,
+        compute_pool_manager,
+        mock_connection,
+        mock_describe_result,
+        sample_compute_pool_data,
     ):
         """Test updating compute pool."""
-        manager = ComputePoolManager(mock_connection)
-
         # Mock the query call for get() after update
-        test_pool_data = sample_compute_pool_data.copy()
-        test_pool_data["name"] = "test_pool"
         mock_connection.query.return_value = mock_describe_result(
-            "compute_pool", test_pool_data
+            "compute_pool", sample_compute_pool_data
         )
-
-        from deltastream_sdk.models import ComputePoolUpdateParams
-
         params = ComputePoolUpdateParams(
             min_units=2, max_units=10, auto_suspend_minutes=30
         )
 
-        await manager.update("test_pool", params)
+        await compute_pool_manager.update("test_pool", params)
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'UPDATE COMPUTE_POOL "test_pool"' in call_args
-        assert "'min.units' = '2'" in call_args
-        assert "'max.units' = '10'" in call_args
-        assert "'auto.suspend.minutes' = '30'" in call_args
+        assert (
+            canonicalize_sql(last_exec_sql(mock_connection))
+            == GOLDEN_UPDATE_COMPUTE_POOL
+        )
 
 
-class TestEntityManager:
-    """Test EntityManager operations."""
+class TestLifecycleOperations:
+    """Test single-statement lifecycle operations across managers."""
+
+    @pytest.mark.parametrize(
+        "manager_fixture, builder, name, expected_sql",
+        LIFECYCLE_BUILDER_CASES,
+    )
+    def test_lifecycle_sql_builder(
+        self, request, manager_fixture, builder, name, expected_sql
+    ):
+        """Test the SQL builders behind lifecycle operations."""
+        manager = request.getfixturevalue(manager_fixture)
+
+        assert getattr(manager, builder)(name) == expected_sql
+
+    @pytest.mark.parametrize(
+        "manager_fixture, method, name, expected_sql",
+        LIFECYCLE_EXEC_CASES,
+    )
+    async def test_lifecycle_sql(
+        self, request, mock_connection, manager_fixture, method, name, expected_sql
+    ):
+        """Test that lifecycle operations emit a single statement."""
+        manager = request.getfixturevalue(manager_fixture)
 
-    @pytest.mark.asyncio
-    async def test_insert_values(self, mock_connection):
-        from deltastream_sdk.resources import EntityManager
+        await getattr(manager, method)(name)
 
-        manager = EntityManager(mock_connection)
+        assert_exec_sql(mock_connection, expected_sql)
 
-        await manager.insert_values(
+
+class TestEntityManager:
+    """Test EntityManager operations."""
+
+    async def test_insert_values(self, entity_manager, mock_connection):
+        await entity_manager.insert_values(
             name="my_entity",
             values=[
                 {"pageId": 10, "pageviews": 123},
@@ -565,48 +793,40 @@ class TestEntityManager:
         assert mock_connection.exec.call_count == 2
 
         # Check the calls were made with the expected SQL
-        calls = mock_connection.exec.call_args_list
-        first_call = calls[0][0][0]
-        second_call = calls[1][0][0]
-
-        assert 'INSERT INTO ENTITY "my_entity"' in first_call
-        assert 'IN STORE "my_store"' in first_call
-        assert '(\'{"pageId": 10, "pageviews": 123}\')' in first_call
-
-        assert 'INSERT INTO ENTITY "my_entity"' in second_call
-        assert 'IN STORE "my_store"' in second_call
-        assert '(\'{"pageId": 15, "pageviews": 256}\')' in second_call
-
-    @pytest.mark.asyncio
-    async def test_insert_values_with_extra_with_params(self, mock_connection):
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
+        calls_sql = joined_exec_sql(mock_connection)
+        assert (
+            calls_sql.count('INSERT INTO ENTITY "my_entity" IN STORE "my_store"') == 2
+        )
+        assert_contains_all(
+            calls_sql,
+            '(\'{"pageId": 10, "pageviews": 123}\')',
+            '(\'{"pageId": 15, "pageviews": 256}\')',
+        )
 
-        await manager.insert_values(
+    async def test_insert_values_with_extra_with_params(
+        self, entity_manager, mock_connection
+    ):
+        await entity_manager.insert_values(
             name="my_entity",
             values=['{"k": "v"}'],
             store="my_store",
             with_params={"topic": "my_topic"},
         )
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'INSERT INTO ENTITY "my_entity"' in call_args
-        assert 'IN STORE "my_store"' in call_args
-        assert "'topic' = 'my_topic'" in call_args
-        assert '(\'{"k": "v"}\')' in call_args
         # Ensure proper SQL structure: INSERT INTO ENTITY ... IN STORE ... VALUE(...) WITH (...)
         expected_pattern = 'INSERT INTO ENTITY "my_entity" IN STORE "my_store" VALUE'
-        assert expected_pattern in call_args
-        assert "WITH (" in call_args
-
-    @pytest.mark.asyncio
-    async def test_insert_values_single_value_exact_sql(self, mock_connection):
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
+        assert_exec_contains(
+            mock_connection,
+            expected_pattern,
+            "'topic' = 'my_topic'",
+            '(\'{"k": "v"}\')',
+            "WITH (",
+        )
 
-        await manager.insert_values(
+    async def test_insert_values_single_value_exact_sql(
+        self, entity_manager, mock_connection
+    ):
+        await entity_manager.insert_values(
             name="test-sdk",
             values=[
                 {"viewtime": 1753311018649, "userid": "User_3", "pageid": "Page_1"}
@@ -614,326 +834,74 @@ class TestEntityManager:
             store="ChristopheKafka",
         )
 
-        call_args = mock_connection.exec.call_args[0][0]
+        call_args = last_exec_sql(mock_connection)
         # Verify the exact SQL format matches the expected syntax
         expected_start = (
             'INSERT INTO ENTITY "test-sdk" IN STORE "ChristopheKafka" VALUE('
         )
         assert call_args.startswith(expected_start)
-        assert '"viewtime": 1753311018649' in call_args
-        assert '"userid": "User_3"' in call_args
-        assert '"pageid": "Page_1"' in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_entity_with_defaults(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test creating a Kafka entity with default parameters."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "pv"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(name="pv")
-
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "pv"' in call_args
-        # No IN STORE or WITH clauses for defaults
-        assert "IN STORE" not in call_args
-        assert "WITH" not in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_entity_with_store(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test creating entity in a specific store."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "pv"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(name="pv", store="demostore")
-
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "pv"' in call_args
-        assert 'IN STORE "demostore"' in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_kafka_entity_with_passthrough_config(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test creating Kafka entity with retention and other topic configurations."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "customers"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(
-            name="customers",
-            store="kafka_store",
-            params={
-                "topic.partitions": "1",
-                "topic.replicas": "2",
-                "kafka.topic.retention.ms": "172800000",
-            },
-        )
-
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "customers"' in call_args
-        assert 'IN STORE "kafka_store"' in call_args
-        assert "WITH (" in call_args
-        assert "'topic.partitions' = '1'" in call_args
-        assert "'topic.replicas' = '2'" in call_args
-        assert "'kafka.topic.retention.ms' = '172800000'" in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_kafka_entity_with_cleanup_policy(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test creating Kafka entity with partitions, replicas, and cleanup policy."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "pv_compact"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(
-            name="pv_compact",
-            params={
-                "topic.partitions": "2",
-                "topic.replicas": "1",
-                "kafka.topic.cleanup.policy": "compact",
-            },
-        )
-
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "pv_compact"' in call_args
-        assert "WITH (" in call_args
-        assert "'topic.partitions' = '2'" in call_args
-        assert "'topic.replicas' = '1'" in call_args
-        assert "'kafka.topic.cleanup.policy' = 'compact'" in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_entity_with_protobuf_descriptors(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test creating entity with key and value ProtoBuf descriptors."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "pv_pb"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(
-            name="pv_pb",
-            params={
-                "key.descriptor": 'pb_key."PageviewsKey"',
-                "value.descriptor": 'pb_value."Pageviews"',
-            },
-        )
-
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "pv_pb"' in call_args
-        assert "WITH (" in call_args
-        assert "'key.descriptor' = 'pb_key.\"PageviewsKey\"'" in call_args
-        assert "'value.descriptor' = 'pb_value.\"Pageviews\"'" in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_kinesis_entity_with_shards(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test creating Kinesis entity with shards parameter."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "pv_kinesis"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(
-            name="pv_kinesis", store="kinesis_store", params={"kinesis.shards": "3"}
+        assert_contains_all(
+            call_args,
+            '"viewtime": 1753311018649',
+            '"userid": "User_3"',
+            '"pageid": "Page_1"',
         )
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "pv_kinesis"' in call_args
-        assert 'IN STORE "kinesis_store"' in call_args
-        assert "WITH (" in call_args
-        assert "'kinesis.shards' = '3'" in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_snowflake_database(
-        self, mock_connection, mock_describe_result, sample_entity_data
+    @pytest.mark.parametrize(
+        "name, store, params, required, forbidden", ENTITY_CREATE_CASES
+    )
+    async def test_create_entity(
+        self,
+        entity_manager,
+        mock_connection,
+        prime_get,
+        name,
+        store,
+        params,
+        required,
+        forbidden,
     ):
-        """Test creating a Snowflake database (case-sensitive name)."""
-        from deltastream_sdk.resources import EntityManager
+        """Test the CREATE ENTITY statement for each store/parameter variant."""
+        prime_get(name)
 
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "DELTA_STREAMING"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
+        await entity_manager.create(name=name, store=store, params=params)
 
-        await manager.create(name="DELTA_STREAMING")
+        call_args = assert_exec_contains(mock_connection, *required)
+        unexpected = [fragment for fragment in forbidden if fragment in call_args]
+        assert not unexpected, f"unexpected {unexpected} in: {call_args}"
 
-        call_args = mock_connection.exec.call_args[0][0]
-        # Name should be properly quoted to preserve case
-        assert 'CREATE ENTITY "DELTA_STREAMING"' in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_snowflake_schema_in_database(
-        self, mock_connection, mock_describe_result, sample_entity_data
+    @pytest.mark.parametrize("name, expected_sql_fragment", ENTITY_NAME_CASES)
+    async def test_create_entity_name_quoting(
+        self, entity_manager, mock_connection, prime_get, name, expected_sql_fragment
     ):
-        """Test creating a Snowflake schema within a database."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
+        """Test that entity names keep their case and have quotes escaped."""
+        prime_get(name)
 
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "DELTA_STREAMING.MY_STREAMING_SCHEMA"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
+        await entity_manager.create(name=name)
 
-        await manager.create(name="DELTA_STREAMING.MY_STREAMING_SCHEMA")
-
-        call_args = mock_connection.exec.call_args[0][0]
-        # Hierarchical name should be properly quoted
-        assert 'CREATE ENTITY "DELTA_STREAMING.MY_STREAMING_SCHEMA"' in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_databricks_catalog(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test creating a Databricks catalog."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "cat1"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
+        assert_exec_contains(mock_connection, expected_sql_fragment)
 
-        await manager.create(name="cat1")
-
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "cat1"' in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_databricks_schema_in_catalog(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test creating a Databricks schema within a catalog."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "cat1.schema1"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(name="cat1.schema1")
-
-        call_args = mock_connection.exec.call_args[0][0]
-        # Hierarchical name should be properly quoted
-        assert 'CREATE ENTITY "cat1.schema1"' in call_args
-
-    @pytest.mark.asyncio
     async def test_create_entity_with_all_parameters(
-        self, mock_connection, mock_describe_result, sample_entity_data
+        self, entity_manager, mock_connection, prime_get
     ):
         """Test creating entity with all possible parameters."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
+        prime_get("complex_entity")
 
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "complex_entity"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(
-            name="complex_entity",
-            store="kafka_store",
-            params={
-                "topic.partitions": "3",
-                "topic.replicas": "2",
-                "kafka.topic.retention.ms": "604800000",
-                "kafka.topic.cleanup.policy": "delete",
-                "key.descriptor": "pb_key.MyKey",
-                "value.descriptor": "pb_value.MyValue",
-            },
+        await entity_manager.create(
+            name="complex_entity", store="kafka_store", params=COMPLEX_ENTITY_PARAMS
         )
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "complex_entity"' in call_args
-        assert 'IN STORE "kafka_store"' in call_args
-        assert "WITH (" in call_args
-        assert "'topic.partitions' = '3'" in call_args
-        assert "'topic.replicas' = '2'" in call_args
-        assert "'kafka.topic.retention.ms' = '604800000'" in call_args
-        assert "'kafka.topic.cleanup.policy' = 'delete'" in call_args
-        assert "'key.descriptor' = 'pb_key.MyKey'" in call_args
-        assert "'value.descriptor' = 'pb_value.MyValue'" in call_args
-
-    @pytest.mark.asyncio
+        assert_exec_contains(mock_connection, *COMPLEX_ENTITY_EXPECTED)
+
     async def test_create_entity_with_case_sensitive_store_name(
-        self, mock_connection, mock_describe_result, sample_entity_data
+        self, entity_manager, mock_connection, prime_get
     ):
         """Test creating entity with case-sensitive store name."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = "my_entity"
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
+        prime_get("my_entity")
 
-        await manager.create(name="my_entity", store="MySpecialStore")
+        await entity_manager.create(name="my_entity", store="MySpecialStore")
 
-        call_args = mock_connection.exec.call_args[0][0]
-        assert 'CREATE ENTITY "my_entity"' in call_args
         # Store name should be properly quoted to preserve case
-        assert 'IN STORE "MySpecialStore"' in call_args
-
-    @pytest.mark.asyncio
-    async def test_create_entity_escapes_special_characters(
-        self, mock_connection, mock_describe_result, sample_entity_data
-    ):
-        """Test that entity names with special characters are properly escaped."""
-        from deltastream_sdk.resources import EntityManager
-
-        manager = EntityManager(mock_connection)
-
-        # Mock the query call for get() after creation
-        entity_data = sample_entity_data.copy()
-        entity_data["name"] = 'entity"with"quotes'
-        mock_connection.query.return_value = mock_describe_result("entity", entity_data)
-
-        await manager.create(name='entity"with"quotes')
-
-        call_args = mock_connection.exec.call_args[0][0]
-        # Quotes in the name should be escaped (doubled)
-        assert 'CREATE ENTITY "entity""with""quotes"' in call_args
+        assert_exec_contains(
+            mock_connection, 'CREATE ENTITY "my_entity"', 'IN STORE "MySpecialStore"'
+        )